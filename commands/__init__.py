@@ -2,12 +2,18 @@
 Commands package for JJ Voice Assistant
 """
 
-from .spotify_commands import SpotifyCommands
-from .whatsapp_commands import WhatsAppCommands
-from .youtube_commands import YouTubeCommands
-from .browser_commands import BrowserCommands
-from .volume_commands import VolumeCommands
-from .command_executor import CommandExecutor
+import importlib
+
+# Handlers are imported on first access so each one only loads its own
+# heavy dependencies (Selenium, Gemini, MediaPipe, ...)
+_LAZY_IMPORTS = {
+    'SpotifyCommands': '.spotify_commands',
+    'WhatsAppCommands': '.whatsapp_commands',
+    'YouTubeCommands': '.youtube_commands',
+    'BrowserCommands': '.browser_commands',
+    'VolumeCommands': '.volume_commands',
+    'CommandExecutor': '.command_executor'
+}
 
 __all__ = [
     'SpotifyCommands',
@@ -16,4 +22,13 @@ __all__ = [
     'BrowserCommands',
     'VolumeCommands',
     'CommandExecutor'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a command handler on first access"""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,22 +3,187 @@ Browser-related commands (search, open websites)
 """
 
 import os
+import re
+import functools
+import threading
+import concurrent.futures
+import shelve
 import shutil
+import time
 import webbrowser
 import winreg
 import json
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import urllib.parse
 from config import Config
-from utils.tts import speak
 
-try:
+
+# Background workers for AI lookups, so a slow lookup can be abandoned at the deadline
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+# Filler that doesn't change which app or site the user means: leading command
+# phrases and "the", plus a trailing "website"/"site"/"page". Each must be
+# separated by whitespace, so domains like open.spotify.com stay intact.
+_FILLER_RE = re.compile(
+    r'^(?:(?:please|can you|open|visit|go to|launch|start|show me|the)\s+)+'
+    r'|(?:\s+(?:website|site|page))+$',
+    re.IGNORECASE
+)
+
+# Well-known sites - resolved without a network call
+_STATIC_URLS = {
+    # Common websites
+    "youtube": "https://www.youtube.com",
+    "facebook": "https://www.facebook.com",
+    "instagram": "https://www.instagram.com",
+    "twitter": "https://x.com",
+    "reddit": "https://www.reddit.com",
+    "github": "https://github.com",
+    "google": "https://www.google.com",
+    "linkedin": "https://www.linkedin.com",
+    "wikipedia": "https://www.wikipedia.org",
+    "stack overflow": "https://stackoverflow.com",
+    # Government & official
+    "sih": "https://sih.gov.in",
+    "aadhaar": "https://uidai.gov.in",
+    "passport": "https://www.passportindia.gov.in",
+    "pan card": "https://www.onlineservices.nsdl.com",
+    "digilocker": "https://www.digilocker.gov.in",
+    "pm modi": "https://www.pmindia.gov.in",
+    "cowin": "https://www.cowin.gov.in",
+    # Exams & education
+    "jee mains": "https://jeemain.nta.ac.in",
+    "jee advanced": "https://jeeadv.ac.in",
+    "neet": "https://exams.nta.ac.in/NEET",
+    "cuet": "https://cuet.samarth.ac.in",
+    "upsc": "https://www.upsc.gov.in",
+    "ssc": "https://ssc.nic.in",
+    "gate exam": "https://gate2025.iisc.ac.in",
+    # Colleges & universities
+    "jiit 62": "https://www.jiit.ac.in",
+    "iit bombay": "https://www.iitb.ac.in",
+    "iit delhi": "https://home.iitd.ac.in",
+    "nit warangal": "https://www.nitw.ac.in",
+    "vit vellore": "https://www.vit.ac.in",
+    "amu": "https://www.amu.ac.in",
+    # Shopping
+    "amazon": "https://www.amazon.in",
+    "flipkart": "https://www.flipkart.com",
+    "myntra": "https://www.myntra.com",
+    "ajio": "https://www.ajio.com",
+    # Banking
+    "sbi": "https://www.onlinesbi.sbi",
+    "hdfc bank": "https://www.hdfcbank.com",
+    "icici": "https://www.icicibank.com",
+    "axis bank": "https://www.axisbank.com",
+    # OTT
+    "netflix": "https://www.netflix.com",
+    "amazon prime": "https://www.primevideo.com",
+    "hotstar": "https://www.hotstar.com",
+    "zee5": "https://www.zee5.com",
+    # Tech services
+    "chatgpt": "https://chat.openai.com",
+    "claude": "https://claude.ai",
+    "gemini": "https://gemini.google.com",
+    "gmail": "https://mail.google.com",
+    "drive": "https://drive.google.com",
+    "google maps": "https://maps.google.com",
+    "outlook": "https://outlook.live.com",
+}
+
+
+# Rules sent server-side as the system instruction; known sites are
+# already answered from _STATIC_URLS, so a handful of examples is enough
+_URL_PROMPT_TEMPLATE = """You map the name of a website to its official URL.
+
+Rules:
+- Respond ONLY with JSON: {"url": "https://...", "confidence": 0.0-1.0}
+- Always return a full https:// URL.
+- Ignore filler words like "open", "website", "visit", "go to".
+- Prefer the official Indian site (.in, .gov.in, .ac.in, .nic.in) for government, exam and education names.
+- Use confidence 0 if you can't identify the site.
+
+Examples:
+"github" -> {"url": "https://github.com", "confidence": 0.99}
+"aadhaar" -> {"url": "https://uidai.gov.in", "confidence": 0.98}
+"jee mains" -> {"url": "https://jeemain.nta.ac.in", "confidence": 0.97}
+"iit bombay" -> {"url": "https://www.iitb.ac.in", "confidence": 0.97}
+"amazon" -> {"url": "https://www.amazon.in", "confidence": 0.99}
+"sbi" -> {"url": "https://www.onlinesbi.sbi", "confidence": 0.98}
+"""
+
+# URL lookup is a short classification - keep the answer small and deterministic
+_URL_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "temperature": 0.0,
+    "max_output_tokens": 64,
+}
+
+_URL_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "url": {"type": "string"},
+        "confidence": {"type": "number"},
+    },
+    "required": ["url", "confidence"],
+}
+
+
+def _normalize_name(name):
+    """Strip filler words so equivalent requests share one name (and cache key)"""
+    name = " ".join(name.split()).lower()
+    return _FILLER_RE.sub("", name) or name
+
+
+def _url_generation_config():
+    """Build the URL lookup config, enforcing the response schema when supported"""
     import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+    
+    try:
+        return genai.GenerationConfig(response_schema=_URL_RESPONSE_SCHEMA, **_URL_GENERATION_CONFIG)
+    except TypeError:
+        # Older SDKs have no response_schema - JSON mime type alone still applies
+        return genai.GenerationConfig(**_URL_GENERATION_CONFIG)
+
+
+def _url_request_options():
+    """Short per-attempt timeout with one quick retry on transient API errors"""
+    from google.api_core import exceptions as google_exceptions
+    from google.api_core import retry as google_retry
+    
+    retry = google_retry.Retry(
+        predicate=google_retry.if_exception_type(
+            google_exceptions.ResourceExhausted,
+            google_exceptions.InternalServerError,
+            google_exceptions.BadGateway,
+            google_exceptions.ServiceUnavailable,
+            google_exceptions.GatewayTimeout
+        ),
+        initial=0.3,
+        multiplier=2.0,
+        maximum=1.0,
+        timeout=Config.GEMINI_LOOKUP_TIMEOUT
+    )
+    return {"timeout": Config.GEMINI_REQUEST_TIMEOUT, "retry": retry}
+
+
+def _announce(voice, msg, spoken):
+    """Speak the result in continuous voice mode, otherwise print it"""
+    if voice:
+        from utils.tts import speak  # Only load the TTS engine when it's used
+        speak(spoken)
+    else:
+        print(msg)
+
+
+@functools.lru_cache(maxsize=1024)
+def _has_url_protocol(name):
+    """Look up a URL protocol in the Windows registry (memoized per name)"""
+    try:
+        with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, name) as key:
+            winreg.QueryValueEx(key, "URL Protocol")
+            return True
+    except OSError:  # Includes FileNotFoundError for missing keys/values
+        return False
 
 
 class BrowserCommands:
@@ -27,218 +192,137 @@ class BrowserCommands:
     def __init__(self, driver_manager):
         self.driver_manager = driver_manager
         self.gemini_model = None
+        self._request_options = None
+        self._url_memo = {}
+        self._url_shelf = None
+        self._ai_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self.driver_manager.prewarm()
         self._initialize_ai()
     
     def _initialize_ai(self):
         """Initialize Gemini AI for smart URL detection"""
-        if GEMINI_AVAILABLE and Config.GEMINI_API_KEY != "your_api_key_here":
+        if not Config.GEMINI_API_KEY or Config.GEMINI_API_KEY == "your_api_key_here":
+            return
+        
+        # The SDK is only imported when a key is configured
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            return
+        
+        try:
+            genai.configure(api_key=Config.GEMINI_API_KEY)
+            self.gemini_model = genai.GenerativeModel(
+                Config.GEMINI_URL_MODEL,
+                system_instruction=_URL_PROMPT_TEMPLATE,
+                generation_config=_url_generation_config()
+            )
+            self._request_options = _url_request_options()
+            print("✅ AI-powered website opening enabled")
+        except Exception as e:
+            print(f"⚠️ AI initialization failed: {e}")
+            return
+        
+        self._open_url_cache()
+        _EXECUTOR.submit(self._warm_ai_connection)
+    
+    def _warm_ai_connection(self):
+        """Open the shared Gemini connection before the first lookup needs it"""
+        # Skip if a real lookup already holds the client - it opens the connection
+        # itself. The usual short timeout keeps a stalled warm-up from holding
+        # the lock long or blocking interpreter exit.
+        if not self._ai_lock.acquire(blocking=False):
+            return
+        try:
+            self.gemini_model.count_tokens("ping", request_options=self._request_options)
+        except Exception:
+            pass
+        finally:
+            self._ai_lock.release()
+    
+    def _open_url_cache(self):
+        """Open the on-disk cache of AI-detected URLs"""
+        try:
+            os.makedirs(Config.CACHE_DIR, exist_ok=True)
+            self._url_shelf = shelve.open(os.path.join(Config.CACHE_DIR, "url_cache.db"))
+        except Exception as e:
+            print(f"⚠️ URL cache unavailable: {e}")
+    
+    def _get_smart_url(self, name):
+        """Figure out the correct URL, checking the caches before asking the AI"""
+        key = _normalize_name(name)
+        
+        url = _STATIC_URLS.get(key)
+        if url:
+            return url
+        
+        # Entries are (url, expires_at): found URLs never expire, failures do
+        entry = self._url_memo.get(key)
+        if entry is None and self._url_shelf is not None:
+            try:
+                with self._cache_lock:
+                    entry = self._url_shelf.get(key)
+            except Exception:
+                entry = None  # Unreadable cache entry - treat it as a miss
+        if entry is not None:
+            url, expires_at = entry
+            if url or time.time() < expires_at:
+                self._url_memo[key] = entry
+                return url
+        
+        if not self.gemini_model:
+            return None
+        
+        url = self._ask_gemini(key)
+        if url:
+            self._remember_url(key, (url, None))
+        else:
+            # Fail fast if the same name is requested again shortly
+            self._remember_url(key, (None, time.time() + Config.URL_NEGATIVE_CACHE_TTL))
+        return url
+    
+    def _remember_url(self, key, entry):
+        """Store a lookup result in both cache tiers"""
+        self._url_memo[key] = entry
+        if self._url_shelf is not None:
             try:
-                genai.configure(api_key=Config.GEMINI_API_KEY)
-                self.gemini_model = genai.GenerativeModel(Config.GEMINI_MODEL)
-                print("✅ AI-powered website opening enabled")
+                with self._cache_lock:
+                    self._url_shelf[key] = entry
+                    self._url_shelf.sync()
             except Exception as e:
-                print(f"⚠️ AI initialization failed: {e}")
+                print(f"⚠️ Could not save URL to cache: {e}")
     
-    def _get_smart_url(self, name):
+    def _ask_gemini(self, name):
         """Use AI to figure out the correct URL"""
         if not self.gemini_model:
             return None
                 
-        prompt = f"""Given the user wants to open: "{name}"
-
-Your job:
-- Determine the most likely correct URL.
-- Handle ALL major categories:
-    • Popular sites (YouTube, IG, FB, etc.)
-    • Government sites (NTA, Aadhaar, Passport, SIH, DigiLocker, etc.)
-    • Exam sites (JEE Mains, JEE Advanced, NEET, CUET, UPSC, SSC, etc.)
-    • College/university websites
-    • Tech services
-    • Shopping sites
-    • Banking sites
-    • OTT platforms
-    • Apps/services that have an obvious official website
-- Remove words like "open", "website", "visit", "go to", etc.
-- Respond ONLY using valid JSON (no markdown, no backticks).
-
-Format:
-{{
-  "url": "https://example.com",
-  "confidence": 0.0-1.0
-}}
-
----------------------------------
-COMMON WEBSITE EXAMPLES
----------------------------------
-Input: "youtube"
-Output: {{"url": "https://www.youtube.com", "confidence": 0.99}}
-
-Input: "facebook"
-Output: {{"url": "https://www.facebook.com", "confidence": 0.99}}
-
-Input: "instagram"
-Output: {{"url": "https://www.instagram.com", "confidence": 0.99}}
-
-Input: "twitter"
-Output: {{"url": "https://x.com", "confidence": 0.95}}
-
-Input: "reddit"
-Output: {{"url": "https://www.reddit.com", "confidence": 0.99}}
-
-Input: "github"
-Output: {{"url": "https://github.com", "confidence": 0.99}}
-
----------------------------------
-SPECIAL CASES (GOVERNMENT & OFFICIAL)
----------------------------------
-Input: "open sih website"
-Output: {{"url": "https://sih.gov.in", "confidence": 0.97}}
-
-Input: "aadhaar"
-Output: {{"url": "https://uidai.gov.in", "confidence": 0.98}}
-
-Input: "passport"
-Output: {{"url": "https://www.passportindia.gov.in", "confidence": 0.98}}
-
-Input: "pan card"
-Output: {{"url": "https://www.onlineservices.nsdl.com", "confidence": 0.95}}
-
-Input: "digilocker"
-Output: {{"url": "https://www.digilocker.gov.in", "confidence": 0.98}}
-
-Input: "pm modi website"
-Output: {{"url": "https://www.pmindia.gov.in", "confidence": 0.95}}
-
-Input: "cowin"
-Output: {{"url": "https://www.cowin.gov.in", "confidence": 0.98}}
-
----------------------------------
-EXAM + EDUCATION SPECIAL CASES
----------------------------------
-Input: "jee mains website"
-Output: {{"url": "https://jeemain.nta.ac.in", "confidence": 0.97}}
-
-Input: "jee advanced"
-Output: {{"url": "https://jeeadv.ac.in", "confidence": 0.97}}
-
-Input: "neet"
-Output: {{"url": "https://exams.nta.ac.in/NEET", "confidence": 0.97}}
-
-Input: "cuet"
-Output: {{"url": "https://cuet.samarth.ac.in", "confidence": 0.97}}
-
-Input: "upsc"
-Output: {{"url": "https://www.upsc.gov.in", "confidence": 0.98}}
-
-Input: "ssc"
-Output: {{"url": "https://ssc.nic.in", "confidence": 0.98}}
-
-Input: "gate exam"
-Output: {{"url": "https://gate2025.iisc.ac.in", "confidence": 0.95}}
-
----------------------------------
-COLLEGE / UNIVERSITY SPECIAL CASES
----------------------------------
-Input: "jiit 62 website"
-Output: {{"url": "https://www.jiit.ac.in", "confidence": 0.95}}
-
-Input: "iit bombay"
-Output: {{"url": "https://www.iitb.ac.in", "confidence": 0.97}}
-
-Input: "iit delhi"
-Output: {{"url": "https://home.iitd.ac.in", "confidence": 0.97}}
-
-Input: "nit warangal"
-Output: {{"url": "https://www.nitw.ac.in", "confidence": 0.95}}
-
-Input: "vit vellore"
-Output: {{"url": "https://www.vit.ac.in", "confidence": 0.95}}
-
-Input: "amu"
-Output: {{"url": "https://www.amu.ac.in", "confidence": 0.95}}
-
----------------------------------
-SHOPPING SPECIAL CASES
----------------------------------
-Input: "amazon"
-Output: {{"url": "https://www.amazon.in", "confidence": 0.99}}
-
-Input: "flipkart"
-Output: {{"url": "https://www.flipkart.com", "confidence": 0.99}}
-
-Input: "myntra"
-Output: {{"url": "https://www.myntra.com", "confidence": 0.99}}
-
-Input: "ajio"
-Output: {{"url": "https://www.ajio.com", "confidence": 0.99}}
-
----------------------------------
-BANKING SPECIAL CASES
----------------------------------
-Input: "sbi"
-Output: {{"url": "https://www.onlinesbi.sbi", "confidence": 0.98}}
-
-Input: "hdfc bank"
-Output: {{"url": "https://www.hdfcbank.com", "confidence": 0.98}}
-
-Input: "icici"
-Output: {{"url": "https://www.icicibank.com", "confidence": 0.98}}
-
-Input: "axis bank"
-Output: {{"url": "https://www.axisbank.com", "confidence": 0.98}}
-
----------------------------------
-OTT SPECIAL CASES
----------------------------------
-Input: "netflix"
-Output: {{"url": "https://www.netflix.com", "confidence": 0.99}}
-
-Input: "amazon prime"
-Output: {{"url": "https://www.primevideo.com", "confidence": 0.99}}
-
-Input: "hotstar"
-Output: {{"url": "https://www.hotstar.com", "confidence": 0.99}}
-
-Input: "zee5"
-Output: {{"url": "https://www.zee5.com", "confidence": 0.99}}
-
----------------------------------
-TECH SERVICES
----------------------------------
-Input: "chatgpt"
-Output: {{"url": "https://chat.openai.com", "confidence": 0.99}}
-
-Input: "claude"
-Output: {{"url": "https://claude.ai", "confidence": 0.99}}
-
-Input: "gemini"
-Output: {{"url": "https://gemini.google.com", "confidence": 0.99}}
-
-Input: "gmail"
-Output: {{"url": "https://mail.google.com", "confidence": 0.95}}
-
-Input: "drive"
-Output: {{"url": "https://drive.google.com", "confidence": 0.95}}
-
----------------------------------
-
-Now determine the URL for: "{name}"
-"""
-
-
+        prompt = f'Website: "{name}"'
+        
         try:
-            response = self.gemini_model.generate_content(prompt)
-            response_text = response.text.strip()
-            
-            # Clean response
-            if response_text.startswith("```json"):
-                response_text = response_text.replace("```json", "").replace("```", "").strip()
-            elif response_text.startswith("```"):
-                response_text = response_text.replace("```", "").strip()
-            
-            data = json.loads(response_text)
+            # The SDK client isn't guaranteed thread-safe across lookups
+            with self._ai_lock:
+                response = self.gemini_model.generate_content(
+                    prompt,
+                    stream=True,
+                    request_options=self._request_options
+                )
+                
+                # Structured output - stop reading as soon as the JSON object is complete
+                response_text = ""
+                for chunk in response:
+                    response_text += chunk.text
+                    try:
+                        data = json.loads(response_text)
+                        break
+                    except json.JSONDecodeError:
+                        continue
+                else:
+                    data = json.loads(response_text)
             
-            if data.get("confidence", 0) > 0:
+            # A missing confidence still counts as an answer; only an explicit 0 rejects it
+            if data.get("confidence", 1) > 0:
                 return data.get("url")
             
         except Exception as e:
@@ -249,146 +333,97 @@ Now determine the URL for: "{name}"
     @staticmethod
     def has_protocol(name):
         """Check if a protocol exists in Windows registry"""
-        try:
-            key = winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, f"{name}")
-            try:
-                winreg.QueryValueEx(key, "URL Protocol")
-                winreg.CloseKey(key)
-                return True
-            except:
-                winreg.CloseKey(key)
-                return False
-        except:
-            return False
+        return _has_url_protocol(name.lower())
     
     def search_google(self, query):
         """Search Google for the given query"""
-        input_mode = Config.get_input_mode()
+        voice = Config.get_input_mode() == "voice_continuous"
         driver = self.driver_manager.get_driver()
         
         if not driver:
             return
         
         try:
-            driver.get("https://www.google.com")
+            # Go straight to the results page - no search box to wait for
+            driver.get("https://www.google.com/search?q=" + urllib.parse.quote_plus(query))
             self.driver_manager.reset_whatsapp_status()  # Reset WhatsApp status
-            
-            wait = WebDriverWait(driver, 10)
-            search_box = wait.until(
-                EC.presence_of_element_located((By.NAME, "q"))
-            )
-            search_box.clear()
-            search_box.send_keys(query)
-            search_box.send_keys(Keys.RETURN)
-            msg = f"✅ Searching Google for: {query}\n"
-            if input_mode == "voice_continuous":
-                speak(f"Searching for {query}")
-            else:
-                print(msg)
+            _announce(voice, f"✅ Searching Google for: {query}\n", f"Searching for {query}")
         except Exception as e:
-            msg = f"❌ Error during search: {e}\n"
-            if input_mode == "voice_continuous":
-                speak("Error during search")
-            else:
-                print(msg)
+            _announce(voice, f"❌ Error during search: {e}\n", "Error during search")
             self.driver_manager.cleanup()
     
     def open_app_or_website(self, name):
         """Open an application or website"""
-        input_mode = Config.get_input_mode()
-        driver = self.driver_manager.get_driver()
+        voice = Config.get_input_mode() == "voice_continuous"
+        # Local checks use the name as given; site lookups use the normalized form
+        key = _normalize_name(name)
         
         # Check if it's an executable
         app_path = shutil.which(name)
         
         if app_path:
             os.startfile(app_path)
-            msg = f"✅ Opened {name}\n"
-            if input_mode == "voice_continuous":
-                speak(f"Opened {name}")
-            else:
-                print(msg)
+            _announce(voice, f"✅ Opened {name}\n", f"Opened {name}")
             return
         
         if name in ["chrome", "msedge", "firefox"]:
             os.system(f"start {name}")
-            msg = f"✅ Opened {name}\n"
-            if input_mode == "voice_continuous":
-                speak(f"Opened {name}")
-            else:
-                print(msg)
+            _announce(voice, f"✅ Opened {name}\n", f"Opened {name}")
             return
         
         if self.has_protocol(name):
             os.system(f"start {name}://")
-            msg = f"✅ Opened {name}\n"
-            if input_mode == "voice_continuous":
-                speak(f"Opened {name}")
-            else:
-                print(msg)
+            _announce(voice, f"✅ Opened {name}\n", f"Opened {name}")
             return
         
+        # Plain navigation goes through the default browser; only WhatsApp
+        # needs the Selenium session for later "message" commands
         if "youtube" in name:
-            if driver:
-                try:
-                    driver.get("https://www.youtube.com")
-                    self.driver_manager.reset_whatsapp_status()  # Reset WhatsApp status
-                    
-                    msg = "✅ Opened YouTube\n"
-                    if input_mode == "voice_continuous":
-                        speak("Opened YouTube")
-                    else:
-                        print(msg)
-                    return
-                except Exception as e:
-                    msg = f"❌ Error opening YouTube: {e}\n"
-                    if input_mode == "voice_continuous":
-                        speak("Error opening YouTube")
-                    else:
-                        print(msg)
-                    self.driver_manager.cleanup()
+            webbrowser.open("https://www.youtube.com")
+            _announce(voice, "✅ Opened YouTube\n", "Opened YouTube")
             return
         
         if "whatsapp" in name:
+            driver = self.driver_manager.get_driver()
             if driver:
                 try:
                     driver.get("https://web.whatsapp.com")
                     self.driver_manager.reset_whatsapp_status()  # Will need to verify login
                     
-                    msg = "✅ Opening WhatsApp Web\n"
-                    if input_mode == "voice_continuous":
-                        speak("Opening WhatsApp")
-                    else:
-                        print(msg)
+                    _announce(voice, "✅ Opening WhatsApp Web\n", "Opening WhatsApp")
                     return
                 except Exception as e:
-                    msg = f"❌ Error opening WhatsApp: {e}\n"
-                    if input_mode == "voice_continuous":
-                        speak("Error opening WhatsApp")
-                    else:
-                        print(msg)
+                    _announce(voice, f"❌ Error opening WhatsApp: {e}\n", "Error opening WhatsApp")
                     self.driver_manager.cleanup()
             return
         
-        # Try AI-powered URL detection first
-        smart_url = self._get_smart_url(name)
+        # Well-known sites skip the AI entirely
+        static_url = _STATIC_URLS.get(key)
+        if static_url:
+            webbrowser.open(static_url)
+            _announce(voice, f"✅ Opened {static_url}\n", f"Opened {name}")
+            return
+        
+        # Try AI-powered URL detection first - the local checks above take well
+        # under a millisecond, so the lookup only starts once they've all missed
+        smart_url_future = _EXECUTOR.submit(self._get_smart_url, key)
+        try:
+            smart_url = smart_url_future.result(timeout=Config.GEMINI_LOOKUP_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            print("⚠️ AI URL detection timed out")
+            smart_url = None
+        except Exception as e:
+            print(f"⚠️ AI URL detection failed: {e}")
+            smart_url = None
         
         if smart_url:
             print(f"🤖 AI detected URL: {smart_url}")
             # Always use webbrowser.open for AI-detected URLs to avoid driver issues
             webbrowser.open(smart_url)
-            msg = f"✅ Opened {smart_url}\n"
-            if input_mode == "voice_continuous":
-                speak(f"Opened {name}")
-            else:
-                print(msg)
+            _announce(voice, f"✅ Opened {smart_url}\n", f"Opened {name}")
             return
         
         # Fallback to traditional method
-        url = f"https://www.{name}.com" if "." not in name else f"https://{name}"
+        url = f"https://www.{key}.com" if "." not in key else f"https://{key}"
         webbrowser.open(url)
-        msg = f"✅ Opened {url}\n"
-        if input_mode == "voice_continuous":
-            speak(f"Opened {name}")
-        else:
-            print(msg)
\ No newline at end of file
+        _announce(voice, f"✅ Opened {url}\n", f"Opened {name}")
\ No newline at end of file
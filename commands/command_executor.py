@@ -4,11 +4,7 @@ Main command executor - routes commands to appropriate handlers
 
 from config import Config
 from utils.tts import speak
-from commands.spotify_commands import SpotifyCommands
-from commands.whatsapp_commands import WhatsAppCommands
-from commands.youtube_commands import YouTubeCommands
 from commands.browser_commands import BrowserCommands
-from commands.volume_commands import VolumeCommands
 
 
 class CommandExecutor:
@@ -18,12 +14,45 @@ class CommandExecutor:
         self.driver_manager = driver_manager
         self.input_handler = input_handler
         
-        # Initialize command handlers
-        self.spotify = SpotifyCommands()
-        self.whatsapp = WhatsAppCommands(driver_manager)
-        self.youtube = YouTubeCommands(driver_manager)
+        # The browser handler starts the WebDriver and Gemini warm-up in the
+        # background, so it is built up front; the rest load on first use
         self.browser = BrowserCommands(driver_manager)
-        self.volume = VolumeCommands()
+        self._spotify = None
+        self._whatsapp = None
+        self._youtube = None
+        self._volume = None
+    
+    @property
+    def spotify(self):
+        """Spotify handler (loads pyautogui on first use)"""
+        if self._spotify is None:
+            from commands.spotify_commands import SpotifyCommands
+            self._spotify = SpotifyCommands()
+        return self._spotify
+    
+    @property
+    def whatsapp(self):
+        """WhatsApp handler, created on first use"""
+        if self._whatsapp is None:
+            from commands.whatsapp_commands import WhatsAppCommands
+            self._whatsapp = WhatsAppCommands(self.driver_manager)
+        return self._whatsapp
+    
+    @property
+    def youtube(self):
+        """YouTube handler, created on first use"""
+        if self._youtube is None:
+            from commands.youtube_commands import YouTubeCommands
+            self._youtube = YouTubeCommands(self.driver_manager)
+        return self._youtube
+    
+    @property
+    def volume(self):
+        """Volume handler (loads MediaPipe, OpenCV and pycaw on first use)"""
+        if self._volume is None:
+            from commands.volume_commands import VolumeCommands
+            self._volume = VolumeCommands()
+        return self._volume
     
     def execute(self, command):
         """Execute the given command"""
@@ -35,7 +64,8 @@ class CommandExecutor:
         
         # Exit command
         if command == "exit":
-            self.volume.stop_volume_control()  # Stop volume control if running
+            if self._volume is not None:
+                self.volume.stop_volume_control()  # Stop volume control if running
             self.driver_manager.cleanup()
             msg = "Goodbye!"
             if input_mode == "voice_continuous":
@@ -2,9 +2,11 @@
 Volume control commands using hand gestures
 """
 
+import math
 import mediapipe as mp
 import cv2
-import math as m
+import numpy as np
+import queue
 import threading
 from config import Config
 from utils.tts import speak
@@ -13,6 +15,41 @@ from comtypes import CLSCTX_ALL
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 import pythoncom
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _update_volume(px4, py4, px8, py8, smooth, factor, min_dist, max_dist):
+    """Map the thumb-index pinch to a volume level and take one smoothing step"""
+    dx = px4 - px8
+    dy = py4 - py8
+    d2 = dx * dx + dy * dy
+    # Squared distance for the clamps; the mapping itself stays linear in distance
+    if d2 <= min_dist * min_dist:
+        v = 0.0
+    elif d2 >= max_dist * max_dist:
+        v = 1.0
+    else:
+        v = (math.sqrt(d2) - min_dist) / (max_dist - min_dist)
+    return smooth + (v - smooth) * factor
+
+
+if NUMBA_AVAILABLE:
+    # Runs every frame - compile to native code when Numba is installed
+    _update_volume = njit(cache=True, fastmath=True)(_update_volume)
+
+
+def _put_latest(q, item):
+    """Put into a single-slot queue, replacing an item the consumer hasn't taken yet"""
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    q.put_nowait(item)
+
 
 class VolumeCommands:
     """Handle volume control using hand gestures"""
@@ -20,6 +57,7 @@ class VolumeCommands:
     def __init__(self):
         self.controller = None
         self.control_thread = None
+        self._hands = None  # Loaded on first start, then reused across start/stop
     
     def start_volume_control(self):
         """Start the volume control in a separate thread"""
@@ -34,7 +72,7 @@ class VolumeCommands:
             
             print("💡 TIP: Volume control uses your webcam - pinch thumb and index finger!")
             
-            self.controller = VolumeController()
+            self.controller = VolumeController(self._get_hands)
             self.control_thread = threading.Thread(
                 target=self.controller.run, 
                 daemon=True
@@ -66,26 +104,67 @@ class VolumeCommands:
                 speak("Volume control is not running")
             else:
                 print(msg)
+    
+    def _get_hands(self):
+        """Return the shared hand model, loading it on first use"""
+        # Loading the model takes hundreds of ms - only do it once. Called from
+        # the control thread; the is_alive check keeps it to one run at a time.
+        if self._hands is None:
+            # Lite model, one hand, tracking between frames
+            self._hands = mp.solutions.hands.Hands(
+                static_image_mode=False,
+                max_num_hands=1,
+                model_complexity=0,
+                min_detection_confidence=0.6,
+                min_tracking_confidence=0.5
+            )
+        return self._hands
 
 
 class VolumeController:
     """Internal volume controller with hand gesture recognition"""
     
-    def __init__(self):
-        self.smooth_vol = 0
+    def __init__(self, get_hands):
+        self._get_hands = get_hands
+        self.hands = None
+        self.smooth_vol = 0.0
         self.smoothing_factor = 0.1
+        # Pinch range in pixels
+        self.min_dist = 15.0
+        self.max_dist = 150.0
         self.is_running = False
+        self._last_set_vol = -1.0  # Last level sent to the OS
+        self._display_vol = 0.0  # Level shown in the preview, refreshed lazily
+        self._font = cv2.FONT_HERSHEY_SIMPLEX
+        self._text_color = (255, 0, 23)
+        self._last_pct = -1
+        self._vol_text = ""
+        self.detect_interval = 2  # Run hand detection on every Nth frame
+        self.frame_idx = 0
     
     def run(self):
         """Main volume control loop"""
+        # Load (or reuse) the hand model here so the command thread never waits on it
+        self.hands = self._get_hands()
+        
+        # Compile the Numba kernel now rather than stalling the first frame
+        _update_volume(0, 0, 0, 0, self.smooth_vol, self.smoothing_factor, self.min_dist, self.max_dist)
+        
         # Initialize COM in this thread
         pythoncom.CoInitialize()
         
-        # Get speakers - this returns a POINTER
-        speakers = AudioUtilities.GetSpeakers()
-        # Activate returns the interface directly
-        interface = speakers.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        volume = cast(interface, POINTER(IAudioEndpointVolume))
+        # IAudioEndpointVolume is the direct WinAPI path - every set is an
+        # in-process COM call, no helper process is spawned
+        try:
+            # Get speakers - this returns a POINTER
+            speakers = AudioUtilities.GetSpeakers()
+            # Activate returns the interface directly
+            interface = speakers.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            volume = cast(interface, POINTER(IAudioEndpointVolume))
+            self._display_vol = volume.GetMasterVolumeLevelScalar()
+        except Exception as e:
+            print(f"❌ Cannot access system volume: {e}")
+            return
         
         self.is_running = True
         cap = cv2.VideoCapture(0)
@@ -94,8 +173,15 @@ class VolumeController:
             print("❌ Cannot access webcam")
             return
         
+        # Ask the camera for small MJPEG frames instead of shrinking every frame ourselves
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, Config.VOLUME_CAPTURE_WIDTH)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, Config.VOLUME_CAPTURE_HEIGHT)
+        cap.set(cv2.CAP_PROP_FPS, Config.VOLUME_CAPTURE_FPS)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Don't let the driver queue up stale frames
+        
         mphands = mp.solutions.hands
-        hands = mphands.Hands(4)
+        self.hands.reset()  # Drop tracking state left over from a previous run
         mpdraw = mp.solutions.drawing_utils
         
         # Window properties for corner placement
@@ -107,57 +193,132 @@ class VolumeController:
         print("   👉 Pinch thumb and index finger to adjust volume")
         print("   👉 Press 'Q' to quit or say 'stop volume'\n")
         
+        # Some drivers ignore the requested size - downscale those frames first so
+        # the flip, color conversion and detection still touch fewer pixels
+        w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or Config.VOLUME_CAPTURE_WIDTH
+        h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or Config.VOLUME_CAPTURE_HEIGHT
+        sf = min(1.0, Config.VOLUME_CAPTURE_WIDTH / w)
+        w2 = int(w * sf)
+        h2 = int(h * sf)
+        resize_to = (w2, h2) if sf < 1.0 else None
+        frame_size = np.array([w2, h2], dtype=np.float32)
+        
+        # pollKey (OpenCV 4.5+) services the window without waitKey's forced 1 ms sleep
+        poll_key = getattr(cv2, "pollKey", None)
+        
+        # Capture -> inference -> render (this thread) run concurrently; each
+        # single-slot queue drops stale items so latency stays at one frame
+        frames = queue.Queue(maxsize=1)
+        detections = queue.Queue(maxsize=1)
+        stages = [
+            threading.Thread(target=self._capture_loop, args=(cap, frames, resize_to), daemon=True),
+            threading.Thread(target=self._inference_loop, args=(frames, detections, (h2, w2, 3)), daemon=True)
+        ]
+        for stage in stages:
+            stage.start()
+        
         while self.is_running:
-            suc, frame = cap.read()
-            if not suc:
-                break
-            
-            frame = cv2.flip(frame, 1)
-            frame = cv2.GaussianBlur(frame, (5, 5), 0)
-            sf = 0.5
-            h, w = frame.shape[:2]
-            h2 = int(h * sf)
-            w2 = int(w * sf)
-            frame = cv2.resize(src=frame, dsize=(w2, h2), interpolation=cv2.INTER_CUBIC)
+            try:
+                frame, landmarks = detections.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            self.frame_idx += 1
             
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = hands.process(frame_rgb)
-            
-            if results.multi_hand_landmarks:
-                for handlms in results.multi_hand_landmarks:
-                    mpdraw.draw_landmarks(frame, handlms, mphands.HAND_CONNECTIONS)
-                    
-                    llm = []
-                    
-                    for id, lm in enumerate(handlms.landmark):
-                        h, w, _ = frame.shape
-                        cx, cy = int(lm.x * w), int(lm.y * h)
-                        llm.append([id, cx, cy])
-                    
-                    cv2.line(frame, (llm[4][1], llm[4][2]), (llm[8][1], llm[8][2]), (255, 0, 0), 2)
-                    dist = m.sqrt(((llm[4][1] - llm[8][1])**2) + ((llm[4][2] - llm[8][2])**2))
-                    
-                    min_dist = 15
-                    max_dist = 150
+            if landmarks:
+                for handlms in landmarks:
+                    if Config.DEBUG_OVERLAY:
+                        mpdraw.draw_landmarks(frame, handlms, mphands.HAND_CONNECTIONS)
                     
-                    vol = (dist - min_dist) / (max_dist - min_dist)
-                    vol = max(0.0, min(1.0, vol))
+                    # All 21 landmarks to frame pixels in one vectorized step
+                    lms = np.fromiter(
+                        (c for lm in handlms.landmark for c in (lm.x, lm.y)),
+                        dtype=np.float32, count=42
+                    ).reshape(21, 2)
+                    pts = (lms * frame_size).astype(np.int32)
                     
-                    self.smooth_vol = self.smooth_vol + (vol - self.smooth_vol) * self.smoothing_factor
+                    thumb = tuple(pts[4].tolist())
+                    index = tuple(pts[8].tolist())
+                    cv2.line(frame, thumb, index, (255, 0, 0), 2)
+                    cv2.circle(frame, thumb, 6, (255, 0, 0), cv2.FILLED)
+                    cv2.circle(frame, index, 6, (255, 0, 0), cv2.FILLED)
+                    self.smooth_vol = _update_volume(
+                        thumb[0], thumb[1], index[0], index[1],
+                        self.smooth_vol, self.smoothing_factor, self.min_dist, self.max_dist
+                    )
                     
-                    volume.SetMasterVolumeLevelScalar(self.smooth_vol, None)
-                    cv2.putText(frame, f"Volume: {int(self.smooth_vol * 100)}%", (50, 100),
-                                cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 23), 2)
+                    # Skip the COM call for sub-0.5% changes - the EMA makes most frames tiny steps
+                    if abs(self.smooth_vol - self._last_set_vol) > 0.005:
+                        volume.SetMasterVolumeLevelScalar(self.smooth_vol, None)
+                        self._last_set_vol = self.smooth_vol
+                    self._display_vol = self._last_set_vol  # Show what the OS actually has
+            elif self._last_set_vol >= 0.0 and self.smooth_vol != self._last_set_vol:
+                # Hand just left - apply the last sub-threshold step so nothing is lost
+                volume.SetMasterVolumeLevelScalar(self.smooth_vol, None)
+                self._last_set_vol = self.smooth_vol
+                self._display_vol = self.smooth_vol
+            elif self.frame_idx % 30 == 0:
+                # No hand - occasionally pick up changes made outside the gesture control
+                self._display_vol = volume.GetMasterVolumeLevelScalar()
+            
+            # Only rebuild the label when the shown percentage changes
+            pct = int(self._display_vol * 100)
+            if pct != self._last_pct:
+                self._vol_text = f"Volume: {pct}%"
+                self._last_pct = pct
+            cv2.putText(frame, self._vol_text, (50, 100), self._font, 1, self._text_color, 2)
             
             cv2.imshow(window_name, frame)
-            if cv2.waitKey(1) & 0xFF == ord('q'):
+            if poll_key:
+                key = poll_key()
+            elif self.frame_idx % 4 == 0:
+                key = cv2.waitKey(1)
+            else:
+                key = -1
+            if key & 0xFF == ord('q'):
                 print("🛑 Volume control stopped (pressed 'Q')")
                 break
         
+        self.is_running = False
+        for stage in stages:
+            stage.join(timeout=1.0)
         cap.release()
         cv2.destroyAllWindows()
-        self.is_running = False
+    
+    def _capture_loop(self, cap, frames, resize_to):
+        """Pipeline stage 1: read, downscale and mirror camera frames"""
+        while self.is_running:
+            suc, frame = cap.read()
+            if not suc:
+                self.is_running = False
+                break
+            
+            if resize_to:
+                frame = cv2.resize(src=frame, dsize=resize_to, interpolation=cv2.INTER_AREA)
+            cv2.flip(frame, 1, dst=frame)
+            _put_latest(frames, frame)
+    
+    def _inference_loop(self, frames, detections, shape):
+        """Pipeline stage 2: pair each frame with the latest hand landmarks"""
+        frame_rgb = np.empty(shape, dtype=np.uint8)
+        landmarks = None
+        count = 0
+        
+        while self.is_running:
+            try:
+                frame = frames.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            # Detection dominates the cost - run it on every Nth frame and reuse the
+            # last landmarks in between; the volume smoothing hides the gap
+            count += 1
+            if count % self.detect_interval == 0:
+                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame_rgb)
+                # MediaPipe tracks the hand from the previous landmarks on its own
+                # and only re-runs palm detection when tracking is lost
+                landmarks = self.hands.process(frame_rgb).multi_hand_landmarks
+            _put_latest(detections, (frame, landmarks))
     
     def stop(self):
         """Stop the volume control"""
-        self.is_running = False
\ No newline at end of file
+        self.is_running = False
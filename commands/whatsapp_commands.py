@@ -3,10 +3,6 @@ WhatsApp-related commands
 """
 
 import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from config import Config
 from utils.tts import speak
 
@@ -19,6 +15,11 @@ class WhatsAppCommands:
     
     def send_message(self, contact, message):
         """Send WhatsApp message via WhatsApp Web - Always clicks first search result"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         input_mode = Config.get_input_mode()
         driver = self.driver_manager.get_driver()
         
@@ -2,11 +2,7 @@
 YouTube-related commands
 """
 
-import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import urllib.parse
 from config import Config
 from utils.tts import speak
 
@@ -19,6 +15,10 @@ class YouTubeCommands:
     
     def play_video(self, query):
         """Play a YouTube video with the given query"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         input_mode = Config.get_input_mode()
         driver = self.driver_manager.get_driver()
         
@@ -26,7 +26,8 @@ class YouTubeCommands:
             return
         
         try:
-            driver.get("https://www.youtube.com")
+            # Go straight to the results page - no search box to wait for
+            driver.get("https://www.youtube.com/results?search_query=" + urllib.parse.quote_plus(query))
             self.driver_manager.reset_whatsapp_status()  # Reset WhatsApp status when navigating away
             
             msg = f"✅ Opening YouTube to play: {query}"
@@ -36,14 +37,6 @@ class YouTubeCommands:
                 print(msg)
             
             wait = WebDriverWait(driver, 10)
-            search_box = wait.until(
-                EC.presence_of_element_located((By.NAME, "search_query"))
-            )
-            search_box.clear()
-            search_box.send_keys(query)
-            search_box.send_keys(Keys.RETURN)
-            
-            time.sleep(3)
             try:
                 first_video = wait.until(
                     EC.element_to_be_clickable((By.XPATH, '(//a[@id="video-title"])[1]'))
@@ -24,9 +24,22 @@ class Config:
     WHATSAPP_QR_SCAN_TIMEOUT = 120
     SELENIUM_WAIT_TIMEOUT = 15
     
+    # Gesture volume control camera settings
+    VOLUME_CAPTURE_WIDTH = 320
+    VOLUME_CAPTURE_HEIGHT = 240
+    VOLUME_CAPTURE_FPS = 30
+    DEBUG_OVERLAY = False  # Draw the full hand skeleton in the preview
+    
     # Gemini AI settings
     GEMINI_API_KEY = ""  # Replace with your actual API key
     GEMINI_MODEL = "gemini-2.5-flash"
+    GEMINI_URL_MODEL = "gemini-2.5-flash-lite"  # Fast model for URL lookups
+    GEMINI_REQUEST_TIMEOUT = 4  # Seconds per API attempt
+    GEMINI_LOOKUP_TIMEOUT = 5  # Seconds for the whole lookup, retries included
+    
+    # Cache settings
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".jj_assistant")
+    URL_NEGATIVE_CACHE_TTL = 60  # Seconds to remember failed AI URL lookups
     
     # Global state
     _input_mode = None
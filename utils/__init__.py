@@ -2,9 +2,24 @@
 Utilities package for JJ Voice Assistant
 """
 
-from .tts import speak
-from .voice_input import VoiceInput
-from .input_handler import InputHandler
-from .driver_manager import DriverManager
+import importlib
 
-__all__ = ['speak', 'VoiceInput', 'InputHandler', 'DriverManager']
\ No newline at end of file
+# Imported on first access so e.g. `utils.driver_manager` doesn't also load
+# the speech recognition and TTS engines
+_LAZY_IMPORTS = {
+    'speak': '.tts',
+    'VoiceInput': '.voice_input',
+    'InputHandler': '.input_handler',
+    'DriverManager': '.driver_manager'
+}
+
+__all__ = ['speak', 'VoiceInput', 'InputHandler', 'DriverManager']
+
+
+def __getattr__(name):
+    """Import a utility on first access"""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,10 +3,7 @@ Selenium WebDriver management
 """
 
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import threading
 from config import Config
 from utils.tts import speak
 
@@ -17,15 +14,28 @@ class DriverManager:
     def __init__(self):
         self.driver = None
         self.whatsapp_logged_in = False
+        self._driver_lock = threading.Lock()
     
     def get_driver(self):
         """Get or create WebDriver instance"""
-        if not self.driver:
-            self.driver = self._create_driver()
-        return self.driver
+        # Callers wait for an in-flight launch (e.g. prewarm) instead of starting another
+        with self._driver_lock:
+            if not self.driver:
+                self.driver = self._create_driver()
+            return self.driver
+    
+    def prewarm(self):
+        """Launch the WebDriver in the background so the first command doesn't wait for it"""
+        threading.Thread(target=self.get_driver, daemon=True).start()
     
     def _create_driver(self):
         """Create a new Chrome WebDriver instance"""
+        # Selenium is only loaded once a browser is actually needed
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from webdriver_manager.chrome import ChromeDriverManager
+        
         options = Options()
         options.binary_location = Config.CHROME_PATH
         
@@ -89,10 +99,11 @@ class DriverManager:
     
     def cleanup(self):
         """Close WebDriver and cleanup"""
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
-            self.driver = None
-            self.whatsapp_logged_in = False
\ No newline at end of file
+        with self._driver_lock:
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except:
+                    pass
+                self.driver = None
+                self.whatsapp_logged_in = False
\ No newline at end of file